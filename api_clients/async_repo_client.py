@@ -0,0 +1,276 @@
+import asyncio
+import time
+import aiohttp
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Any
+from config import GITHUB_TOKEN, BASE_URL
+from api_clients.repo_client import (
+    RepoClient, ValidationError, GitHubAPIError, CreateRepoPayload, UpdateRepoPayload, _json_loads
+)
+
+class AsyncRepoClient:
+    """Asynchronous client for GitHub's Repository API.
+
+    Mirrors RepoClient on top of aiohttp so that independent repository operations
+    can overlap instead of running back to back. The client must be opened before use,
+    most conveniently as an async context manager:
+
+        async with AsyncRepoClient() as client:
+            await asyncio.gather(client.get_repo("first"), client.get_repo("second"))
+
+    In-flight requests are bounded by a semaphore to stay clear of GitHub's
+    secondary rate limits.
+    """
+
+    MAX_CONCURRENCY = 10
+    MAX_RATE_LIMIT_RETRIES = 3
+    MAX_RETRY_DELAY = 60
+    DEFAULT_TIMEOUT = RepoClient.DEFAULT_TIMEOUT
+
+    def __init__(self, token: Optional[str] = None, base_url: str = None,
+                 max_concurrency: int = MAX_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT):
+        """Initialize the asynchronous GitHub Repository client.
+
+        Args:
+            token: GitHub personal access token. If not provided, uses GITHUB_TOKEN from environment.
+            base_url: Base URL for GitHub API. Defaults to config.BASE_URL.
+            max_concurrency: Maximum number of requests in flight at once.
+            timeout: Total seconds allowed for each request.
+
+        Raises:
+            ValidationError: If token is not provided and GITHUB_TOKEN is not set.
+        """
+        self.token = token or GITHUB_TOKEN
+        self.base_url = base_url or BASE_URL
+
+        if not self.token:
+            raise ValidationError("GitHub token is required. Set GITHUB_TOKEN environment variable or pass token parameter.")
+
+        self.headers = {
+            "Authorization": f"token {self.token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.username: Optional[str] = None
+        self._repos_path: Optional[str] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def open(self) -> "AsyncRepoClient":
+        """Opens the HTTP session and verifies the token with GitHub API.
+
+        Returns:
+            AsyncRepoClient: The client itself.
+
+        Raises:
+            GitHubAPIError: If there's an error verifying the token with GitHub API.
+        """
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrency, keepalive_timeout=75)
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            user = await self._request("GET", "/user", "authenticate with GitHub")
+        except GitHubAPIError as e:
+            await self.close()
+            if e.status_code == 401:
+                raise GitHubAPIError("Invalid GitHub token. Please check your credentials.", status_code=401) from e
+            raise
+        self.username = user['login']
+        self._repos_path = f"/repos/{self.username}"
+        return self
+
+    async def close(self) -> None:
+        """Closes the underlying HTTP session and releases pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> "AsyncRepoClient":
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        """Parses a Retry-After header given either as seconds or as an HTTP-date.
+
+        Args:
+            value: The raw header value.
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the header is malformed.
+        """
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(retry_at.timestamp() - time.time(), 0)
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+        """Works out how long to wait before retrying a rate-limited response.
+
+        Args:
+            response: The 403 or 429 response from GitHub API.
+            attempt: Zero-based number of the attempt that was rate limited.
+
+        Returns:
+            Optional[float]: Seconds to sleep, or None if the response should not be retried.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            delay = self._parse_retry_after(retry_after)
+            if delay is None:
+                # Unparseable header still signals rate limiting
+                delay = 2 ** attempt
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset = float(response.headers.get("X-RateLimit-Reset", time.time()))
+            except ValueError:
+                return None
+            delay = max(reset - time.time(), 0)
+        elif response.status == 429:
+            delay = 2 ** attempt
+        else:
+            # A plain 403 is a permissions error, not rate limiting
+            return None
+        return delay if delay <= self.MAX_RETRY_DELAY else None
+
+    async def _request(self, method: str, path: str, action: str,
+                       payload: Optional[Dict[str, Any]] = None) -> Any:
+        """Sends a request to GitHub API, waiting out rate limits.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the base URL.
+            action: Description of the operation used in error messages.
+            payload: JSON body of the request.
+
+        Returns:
+            Any: The decoded JSON body, or None for 204 No Content.
+
+        Raises:
+            GitHubAPIError: If the client is not open or the API request fails.
+        """
+        if self.session is None:
+            raise GitHubAPIError(f"Failed to {action}: client is not open.")
+
+        url = f"{self.base_url}{path}"
+
+        async with self._semaphore:
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                try:
+                    async with self.session.request(method, url, json=payload) as response:
+                        status = response.status
+                        delay = None
+                        if status in (403, 429) and attempt < self.MAX_RATE_LIMIT_RETRIES:
+                            delay = self._retry_delay(response, attempt)
+                        if delay is None:
+                            if status == 204:
+                                return None
+                            try:
+                                data = await response.json(loads=_json_loads, content_type=None)
+                            except ValueError:
+                                data = None  # Empty or non-JSON body
+                            if status >= 400:
+                                message = data.get('message') if isinstance(data, dict) else None
+                                raise GitHubAPIError(
+                                    f"Failed to {action}: {message or f'HTTP {status}'}",
+                                    status_code=status
+                                )
+                            return data
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise GitHubAPIError(f"Failed to {action}: {str(e)}") from e
+                # Keep the semaphore while backing off so other requests wait too
+                await asyncio.sleep(delay)
+
+    async def create_repo(self, repo_name: str, description: str = "", private: bool = False) -> Dict[str, Any]:
+        """Creates a new repository for the authenticated user.
+
+        Args:
+            repo_name: Name of the repository to create.
+            description: Description of the repository.
+            private: Whether the repository should be private.
+
+        Returns:
+            Dict[str, Any]: The created repository as returned by GitHub API.
+
+        Raises:
+            ValidationError: If repository name is invalid.
+            GitHubAPIError: If the API request fails.
+        """
+        payload = CreateRepoPayload(repo_name, description, private)
+        return await self._request("POST", "/user/repos", "create repository", payload.to_json())
+
+    async def get_repo(self, repo_name: str) -> Dict[str, Any]:
+        """Gets details of a specific repository.
+
+        Args:
+            repo_name: Name of the repository to retrieve.
+
+        Returns:
+            Dict[str, Any]: The repository as returned by GitHub API.
+
+        Raises:
+            ValidationError: If repository name is invalid.
+            GitHubAPIError: If the API request fails.
+        """
+        RepoClient._validate_repo_name(repo_name)
+
+        return await self._request(
+            "GET",
+            f"{self._repos_path}/{repo_name}",
+            f"get repository '{repo_name}'"
+        )
+
+    async def update_repo(self, repo_name: str, new_description: str) -> Dict[str, Any]:
+        """Updates a repository's description.
+
+        Args:
+            repo_name: Name of the repository to update.
+            new_description: New description for the repository.
+
+        Returns:
+            Dict[str, Any]: The updated repository as returned by GitHub API.
+
+        Raises:
+            ValidationError: If repository name is invalid or description is not a string.
+            GitHubAPIError: If the API request fails.
+        """
+        RepoClient._validate_repo_name(repo_name)
+        payload = UpdateRepoPayload(new_description)
+
+        return await self._request(
+            "PATCH",
+            f"{self._repos_path}/{repo_name}",
+            f"update repository '{repo_name}'",
+            payload.to_json()
+        )
+
+    async def delete_repo(self, repo_name: str) -> None:
+        """Deletes a repository.
+
+        Args:
+            repo_name: Name of the repository to delete.
+
+        Raises:
+            ValidationError: If repository name is invalid.
+            GitHubAPIError: If the API request fails.
+        """
+        RepoClient._validate_repo_name(repo_name)
+
+        await self._request(
+            "DELETE",
+            f"{self._repos_path}/{repo_name}",
+            f"delete repository '{repo_name}'"
+        )
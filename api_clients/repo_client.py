@@ -1,8 +1,31 @@
-import re
-import requests
-from typing import Dict, Optional, Any, Union
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import string
+import sys
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any, Tuple, Union
 from config import GITHUB_TOKEN, BASE_URL
-from requests.exceptions import RequestException
+
+if TYPE_CHECKING:
+    # requests is imported lazily by _default_session so that importing this module,
+    # e.g. for mock-only unit tests, does not pull in requests/urllib3
+    import requests
+
+try:
+    # Optional: orjson decodes GitHub payloads several times faster than the stdlib
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# GitHub repository name rules
+REPO_NAME_PATTERN = r'^[a-zA-Z0-9_.-]+$'
+MAX_REPO_NAME_LENGTH = 100
+_REPO_NAME_CHARS = (string.ascii_letters + string.digits + "_.-").encode('ascii')
 
 class RepoClientError(Exception):
     """Base exception for RepoClient errors."""
@@ -18,23 +41,218 @@ class GitHubAPIError(RepoClientError):
         self.status_code = status_code
         super().__init__(message)
 
+class BulkCreateError(GitHubAPIError):
+    """Raised when some mutations of a bulk_create request fail.
+    
+    The repositories in ``created`` were created anyway and are the caller's to clean up.
+    """
+    def __init__(self, message: str, created: List[str], status_code: Optional[int] = None):
+        self.created = created
+        super().__init__(message, status_code=status_code)
+
+@dataclass(frozen=True)
+class CreateRepoPayload:
+    """Request body for creating a repository, validated once on construction.
+    
+    Raises:
+        ValidationError: If the repository name is invalid or description is not a string.
+    """
+    name: str
+    description: str = ""
+    private: bool = False
+    auto_init: bool = False  # Don't initialize with README
+    
+    def __post_init__(self):
+        RepoClient._validate_repo_name(self.name)
+        if type(self.description) is not str:
+            raise ValidationError("Description must be a string.")
+    
+    def to_json(self) -> Dict[str, Any]:
+        """Returns the JSON body, built directly rather than deep-copied by asdict."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "private": self.private,
+            "auto_init": self.auto_init
+        }
+
+@dataclass(frozen=True)
+class UpdateRepoPayload:
+    """Request body for updating a repository's description, validated once on construction.
+    
+    Raises:
+        ValidationError: If description is not a string.
+    """
+    description: str
+    
+    def __post_init__(self):
+        if type(self.description) is not str:
+            raise ValidationError("Description must be a string.")
+    
+    def to_json(self) -> Dict[str, Any]:
+        """Returns the JSON body of the request."""
+        return {"description": self.description}
+
+@functools.lru_cache(maxsize=None)
+def _rate_limit_retry_class() -> type:
+    """Returns a urllib3 Retry subclass that also waits out GitHub's secondary rate limits.
+    
+    GitHub signals a secondary rate limit with 403 and a Retry-After header, but urllib3
+    only honours Retry-After for 413, 429 and 503. A 403 without Retry-After is a
+    permissions error and is still returned straight away. Built on first use so that
+    urllib3 is only imported along with requests.
+    
+    POST is left out of allowed_methods so that a create is never resent after a 5xx or
+    a read timeout, either of which may hide a success. GitHub rejects a rate-limited
+    request without processing it, though, so a 403 or 429 with Retry-After is resent
+    for POST too.
+    """
+    from urllib3.util.retry import Retry
+    
+    class RateLimitRetry(Retry):
+        RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES | {403}
+        
+        def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+            if method.upper() == "POST":
+                return bool(
+                    self.total
+                    and self.respect_retry_after_header
+                    and has_retry_after
+                    and status_code in (403, 429)
+                )
+            return super().is_retry(method, status_code, has_retry_after)
+    
+    return RateLimitRetry
+
+def _default_session() -> requests.Session:
+    """Builds the session RepoClient uses when no session_factory is given.
+    
+    The session retries transient server errors and rate limiting with exponential
+    backoff over an enlarged keep-alive connection pool. POST is only resent when
+    GitHub rate limits it, see _rate_limit_retry_class.
+    
+    Returns:
+        requests.Session: A new session with the retrying adapter mounted.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    # raise_on_status=False hands the final response back so the status code
+    # still reaches GitHubAPIError once retries are exhausted.
+    retry = _rate_limit_retry_class()(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["HEAD", "GET", "PATCH", "DELETE"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _is_request_exception(error: Exception) -> bool:
+    """Checks whether an error was raised by requests without importing it.
+    
+    If requests was never imported, e.g. with a stub session_factory, nothing can
+    have raised one of its exceptions.
+    """
+    exceptions = sys.modules.get("requests.exceptions")
+    return exceptions is not None and isinstance(error, exceptions.RequestException)
+
+def _wrap_github_errors(action: str, allowed_statuses: Tuple[int, ...] = ()) -> Callable[[Callable[..., requests.Response]], Callable[..., requests.Response]]:
+    """Turns failures of a RepoClient request method into GitHubAPIError.
+    
+    The wrapped method returns the raw response; any status of 400 or above is raised
+    by inspecting the status code rather than through raise_for_status, so the happy
+    path never constructs an exception. Network failures raised by requests are
+    translated as well.
+    
+    Methods that declare a keyword-only quiet parameter may be called with quiet=True
+    to have a 404 raise a plain GitHubAPIError("not found"). That only skips binding the
+    arguments and formatting the descriptive message, for callers that catch and
+    discard missing repositories.
+    
+    Args:
+        action: What the method does, used in the error message. May reference the
+            method's arguments by name, e.g. "get repository '{repo_name}'".
+        allowed_statuses: Error statuses returned to the caller instead of raised.
+    """
+    def decorator(func: Callable[..., requests.Response]) -> Callable[..., requests.Response]:
+        signature = inspect.signature(func)
+        accepts_quiet = "quiet" in signature.parameters
+        
+        def describe(self, args, kwargs) -> str:
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            return action.format(**arguments)
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                response = func(self, *args, **kwargs)
+            except RepoClientError:
+                raise
+            except Exception as e:
+                if not _is_request_exception(e):
+                    raise
+                # requests always sets .response, to None when no response was received
+                status_code = e.response.status_code if e.response is not None else None
+                raise GitHubAPIError(
+                    f"Failed to {describe(self, args, kwargs)}: {str(e)}",
+                    status_code=status_code
+                ) from e
+            
+            status_code = response.status_code
+            if status_code < 400 or status_code in allowed_statuses:
+                return response
+            if status_code == 404 and accepts_quiet and kwargs.get("quiet"):
+                raise GitHubAPIError("not found", status_code=404)
+            raise GitHubAPIError(
+                f"Failed to {describe(self, args, kwargs)}: HTTP {status_code} {response.reason}",
+                status_code=status_code
+            )
+        return wrapper
+    return decorator
+
 class RepoClient:
     """Client for interacting with GitHub's Repository API.
     
     This client provides methods to create, read, update, and delete GitHub repositories
     with proper error handling and input validation.
+    
+    create_repo, get_repo, update_repo and delete_repo (and bulk_delete, which forwards
+    it) accept quiet=True to raise a bare GitHubAPIError("not found") on 404, skipping
+    the descriptive message for callers that ignore missing repositories, e.g. in cleanup.
     """
     
-    # GitHub repository name rules
-    REPO_NAME_PATTERN = r'^[a-zA-Z0-9_.-]+$'
-    MAX_REPO_NAME_LENGTH = 100
+    # Module-level name rules, re-exposed on the class
+    REPO_NAME_PATTERN = REPO_NAME_PATTERN
+    MAX_REPO_NAME_LENGTH = MAX_REPO_NAME_LENGTH
+    
+    # Seconds to wait for GitHub to connect or respond
+    DEFAULT_TIMEOUT = 10
+    
+    # Most get_repo responses kept per client; the oldest entry is evicted first
+    GET_CACHE_MAXSIZE = 256
+    
+    # Authenticated logins keyed by (base_url, token), shared by every client in the process
+    _USER_CACHE: Dict[Tuple[str, str], str] = {}
     
-    def __init__(self, token: Optional[str] = None, base_url: str = None):
+    def __init__(self, token: Optional[str] = None, base_url: str = None, cache_ttl: float = 5.0,
+                 session_factory: Optional[Callable[[], requests.Session]] = None,
+                 timeout: float = DEFAULT_TIMEOUT):
         """Initialize the GitHub Repository client.
         
         Args:
             token: GitHub personal access token. If not provided, uses GITHUB_TOKEN from environment.
             base_url: Base URL for GitHub API. Defaults to config.BASE_URL.
+            cache_ttl: Seconds a get_repo response is reused before it is revalidated with its
+                ETag. 0 always revalidates.
+            session_factory: Callable returning the HTTP session to use. Defaults to a
+                requests.Session with connection pooling and retries.
+            timeout: Seconds to wait for GitHub to connect or respond, applied to every request.
             
         Raises:
             ValidationError: If token is not provided and GITHUB_TOKEN is not set.
@@ -42,33 +260,105 @@ class RepoClient:
         """
         self.token = token or GITHUB_TOKEN
         self.base_url = base_url or BASE_URL
+        self.timeout = timeout
         
         if not self.token:
             raise ValidationError("GitHub token is required. Set GITHUB_TOKEN environment variable or pass token parameter.")
             
-        self.headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+        # Reuse a single session so consecutive calls share pooled keep-alive connections.
+        # Headers live on the session so requests are sent without per-call header dicts.
+        self.session = (session_factory or _default_session)()
+        self.session.headers["Authorization"] = f"token {self.token}"
+        self.session.headers["Accept"] = "application/vnd.github.v3+json"
+        
+        # Short-lived cache of (fetched at, response, ETag) keyed by repository name
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[str, Tuple[float, requests.Response, Optional[str]]] = {}
+        
+        # Reuse the login if this token was already verified by an earlier client
+        cache_key = (self.base_url, self.token)
+        self.username = RepoClient._USER_CACHE.get(cache_key)
+        if self.username is None:
+            try:
+                self.username = self._json(self._get_user(), "authenticate with GitHub")['login']
+            except Exception:
+                # No client is returned, so nobody else can release the pooled connections
+                self.session.close()
+                raise
+            RepoClient._USER_CACHE[cache_key] = self.username
+        
+        # Prebuilt URL prefixes so each call only appends the repository name
+        self._user_repos_url = f"{self.base_url}/user/repos"
+        self._repos_base = f"{self.base_url}/repos/{self.username}"
+        # GitHub Enterprise serves REST under /api/v3 but GraphQL at /api/graphql
+        if self.base_url.rstrip("/").endswith("/api/v3"):
+            self._graphql_url = f"{self.base_url.rstrip('/')[:-len('/v3')]}/graphql"
+        else:
+            self._graphql_url = f"{self.base_url}/graphql"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers sent with every request, as stored on the session."""
+        return self.session.headers
+
+    @_wrap_github_errors("authenticate with GitHub")
+    def _get_user(self) -> requests.Response:
+        """Gets the authenticated user, verifying the token.
+        
+        Returns:
+            requests.Response: The response from GitHub API.
+            
+        Raises:
+            GitHubAPIError: If there's an error verifying the token with GitHub API.
+        """
+        response = self.session.get(
+            f"{self.base_url}/user",
+            timeout=self.timeout
+        )
+        if response.status_code == 401:
+            raise GitHubAPIError("Invalid GitHub token. Please check your credentials.", status_code=401)
+        return response
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session and releases pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "RepoClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _json(response: requests.Response, action: str) -> Any:
+        """Decodes a JSON response body, using orjson when it is installed.
         
+        Args:
+            response: The response from GitHub API.
+            action: Description of the operation used in the error message.
+            
+        Returns:
+            Any: The decoded JSON body.
+            
+        Raises:
+            GitHubAPIError: If the body is not valid JSON, e.g. a proxy's HTML page.
+        """
         try:
-            # Verify the token and get the authenticated user
-            user_response = requests.get(
-                f"{self.base_url}/user",
-                headers=self.headers,
-                timeout=10
-            )
-            user_response.raise_for_status()
-            self.username = user_response.json()['login']
-        except RequestException as e:
-            status_code = getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            if status_code == 401:
-                raise GitHubAPIError("Invalid GitHub token. Please check your credentials.", status_code=401) from e
-            raise GitHubAPIError(f"Failed to authenticate with GitHub: {str(e)}", status_code=status_code) from e
-
-    def _validate_repo_name(self, repo_name: str) -> None:
+            return _json_loads(response.content)
+        except ValueError as e:
+            raise GitHubAPIError(
+                f"Failed to {action}: invalid JSON in response ({e})",
+                status_code=response.status_code
+            ) from e
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _validate_repo_name(repo_name: str) -> None:
         """Validates repository name against GitHub's naming rules.
         
+        Validation is pure, so results are memoized; names that fail raise and are
+        therefore never cached.
+        
         Args:
             repo_name: Name of the repository to validate.
             
@@ -78,13 +368,19 @@ class RepoClient:
         if not repo_name:
             raise ValidationError("Repository name cannot be empty.")
             
-        if len(repo_name) > self.MAX_REPO_NAME_LENGTH:
+        if len(repo_name) > MAX_REPO_NAME_LENGTH:
             raise ValidationError(
-                f"Repository name cannot exceed {self.MAX_REPO_NAME_LENGTH} characters. "
+                f"Repository name cannot exceed {MAX_REPO_NAME_LENGTH} characters. "
                 f"Got {len(repo_name)} characters."
             )
             
-        if not re.match(self.REPO_NAME_PATTERN, repo_name):
+        # Purely alphanumeric ASCII names are accepted by C-level string checks alone.
+        # Otherwise, deleting every allowed byte leaves something behind only if an
+        # invalid character is present.
+        if not repo_name.isascii() or (
+            not repo_name.isalnum()
+            and repo_name.encode('ascii').translate(None, _REPO_NAME_CHARS)
+        ):
             raise ValidationError(
                 "Repository name can only contain alphanumeric characters, '-', '_', and '.'"
             )
@@ -92,13 +388,16 @@ class RepoClient:
         if repo_name[0] == '-' or repo_name[-1] == '.':
             raise ValidationError("Repository name cannot start with '-' or end with '.'")
     
-    def create_repo(self, repo_name: str, description: str = "", private: bool = False) -> requests.Response:
+    @_wrap_github_errors("create repository")
+    def create_repo(self, repo_name: str, description: str = "", private: bool = False,
+                    *, quiet: bool = False) -> requests.Response:
         """Creates a new repository for the authenticated user.
         
         Args:
             repo_name: Name of the repository to create.
             description: Description of the repository.
             private: Whether the repository should be private.
+            quiet: On 404, raise a bare GitHubAPIError("not found"); see _wrap_github_errors.
             
         Returns:
             requests.Response: The response from GitHub API.
@@ -107,43 +406,28 @@ class RepoClient:
             ValidationError: If repository name is invalid.
             GitHubAPIError: If the API request fails.
         """
-        self._validate_repo_name(repo_name)
+        payload = CreateRepoPayload(repo_name, description, private)
         
-        if not isinstance(description, str):
-            raise ValidationError("Description must be a string.")
-            
-        url = f"{self.base_url}/user/repos"
-        payload = {
-            "name": repo_name,
-            "description": description,
-            "private": private,
-            "auto_init": False  # Don't initialize with README
-        }
+        self._get_cache.pop(repo_name, None)
+        url = self._user_repos_url
         
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response
-        except RequestException as e:
-            status_code = getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            if status_code == 422:
-                error_msg = e.response.json().get('message', 'Validation failed')
-                raise GitHubAPIError(f"Failed to create repository: {error_msg}", status_code=422) from e
-            raise GitHubAPIError(
-                f"Failed to create repository: {str(e)}",
-                status_code=status_code
-            ) from e
+        response = self.session.post(
+            url,
+            json=payload.to_json(),
+            timeout=self.timeout
+        )
+        if response.status_code == 422:
+            error_msg = self._json(response, "create repository").get('message', 'Validation failed')
+            raise GitHubAPIError(f"Failed to create repository: {error_msg}", status_code=422)
+        return response
 
-    def get_repo(self, repo_name: str) -> requests.Response:
+    @_wrap_github_errors("get repository '{repo_name}'")
+    def get_repo(self, repo_name: str, *, quiet: bool = False) -> requests.Response:
         """Gets details of a specific repository.
         
         Args:
             repo_name: Name of the repository to retrieve.
+            quiet: On 404, raise a bare GitHubAPIError("not found"); see _wrap_github_errors.
             
         Returns:
             requests.Response: The response from GitHub API.
@@ -154,29 +438,82 @@ class RepoClient:
         """
         self._validate_repo_name(repo_name)
         
-        url = f"{self.base_url}/repos/{self.username}/{repo_name}"
+        cached = self._get_cache.get(repo_name)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
         
-        try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response
-        except RequestException as e:
-            status_code = getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            raise GitHubAPIError(
-                f"Failed to get repository '{repo_name}': {str(e)}",
-                status_code=status_code
-            ) from e
+        url = f"{self._repos_base}/{repo_name}"
+        
+        # Revalidate a stale entry with its ETag; GitHub answers 304 without a body
+        # and does not count it against the rate limit.
+        etag = cached[2] if cached is not None else None
+        extra_headers = {"If-None-Match": etag} if etag else None
+        
+        response = self.session.get(
+            url,
+            headers=extra_headers,
+            timeout=self.timeout
+        )
+        if response.status_code == 304:
+            response = cached[1]
+        elif response.status_code >= 400:
+            self._get_cache.pop(repo_name, None)
+            return response  # Raised as GitHubAPIError by the decorator
+        else:
+            etag = response.headers.get('ETag')
+        
+        # Re-inserting moves the entry to the end, so the first key is the oldest
+        self._get_cache.pop(repo_name, None)
+        if len(self._get_cache) >= self.GET_CACHE_MAXSIZE:
+            del self._get_cache[next(iter(self._get_cache))]
+        self._get_cache[repo_name] = (time.monotonic(), response, etag)
+        return response
+
+    @_wrap_github_errors("check repository '{repo_name}'", allowed_statuses=(404,))
+    def _head_repo(self, repo_name: str) -> requests.Response:
+        """Sends a HEAD request for a repository, which returns headers but no body.
+        
+        Args:
+            repo_name: Name of the repository to probe.
+            
+        Returns:
+            requests.Response: The response from GitHub API (404 if the repository does not exist).
+            
+        Raises:
+            ValidationError: If repository name is invalid.
+            GitHubAPIError: If the API request fails.
+        """
+        self._validate_repo_name(repo_name)
+        
+        return self.session.head(
+            f"{self._repos_base}/{repo_name}",
+            allow_redirects=False,
+            timeout=self.timeout
+        )
+
+    def exists(self, repo_name: str) -> bool:
+        """Checks whether a repository exists without downloading its details.
+        
+        Args:
+            repo_name: Name of the repository to check.
+            
+        Returns:
+            bool: True if the repository exists under this name, False otherwise.
+            
+        Raises:
+            ValidationError: If repository name is invalid.
+            GitHubAPIError: If the API request fails for a reason other than 404.
+        """
+        return self._head_repo(repo_name).status_code == 200
 
-    def update_repo(self, repo_name: str, new_description: str) -> requests.Response:
+    @_wrap_github_errors("update repository '{repo_name}'")
+    def update_repo(self, repo_name: str, new_description: str, *, quiet: bool = False) -> requests.Response:
         """Updates a repository's description.
         
         Args:
             repo_name: Name of the repository to update.
             new_description: New description for the repository.
+            quiet: On 404, raise a bare GitHubAPIError("not found"); see _wrap_github_errors.
             
         Returns:
             requests.Response: The response from GitHub API.
@@ -186,36 +523,25 @@ class RepoClient:
             GitHubAPIError: If the API request fails.
         """
         self._validate_repo_name(repo_name)
-        
-        if not isinstance(new_description, str):
-            raise ValidationError("Description must be a string.")
+        payload = UpdateRepoPayload(new_description)
             
-        url = f"{self.base_url}/repos/{self.username}/{repo_name}"
-        payload = {
-            "description": new_description
-        }
+        self._get_cache.pop(repo_name, None)
+        url = f"{self._repos_base}/{repo_name}"
         
-        try:
-            response = requests.patch(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response
-        except RequestException as e:
-            status_code = getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            raise GitHubAPIError(
-                f"Failed to update repository '{repo_name}': {str(e)}",
-                status_code=status_code
-            ) from e
+        response = self.session.patch(
+            url,
+            json=payload.to_json(),
+            timeout=self.timeout
+        )
+        return response
 
-    def delete_repo(self, repo_name: str) -> requests.Response:
+    @_wrap_github_errors("delete repository '{repo_name}'")
+    def delete_repo(self, repo_name: str, *, quiet: bool = False) -> requests.Response:
         """Deletes a repository.
         
         Args:
             repo_name: Name of the repository to delete.
+            quiet: On 404, raise a bare GitHubAPIError("not found"); see _wrap_github_errors.
             
         Returns:
             requests.Response: The response from GitHub API (204 No Content on success).
@@ -226,19 +552,113 @@ class RepoClient:
         """
         self._validate_repo_name(repo_name)
         
-        url = f"{self.base_url}/repos/{self.username}/{repo_name}"
+        self._get_cache.pop(repo_name, None)
+        url = f"{self._repos_base}/{repo_name}"
         
-        try:
-            response = requests.delete(
-                url,
-                headers=self.headers,
-                timeout=10
+        response = self.session.delete(
+            url,
+            timeout=self.timeout
+        )
+        return response
+
+    @_wrap_github_errors("run GraphQL query")
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> requests.Response:
+        """Sends a query to GitHub's GraphQL API.
+        
+        Args:
+            query: The GraphQL query or mutation document.
+            variables: Values for the variables declared by the query.
+            
+        Returns:
+            requests.Response: The response from GitHub API.
+            
+        Raises:
+            GitHubAPIError: If the API request fails.
+        """
+        return self.session.post(
+            self._graphql_url,
+            json={"query": query, "variables": variables},
+            timeout=self.timeout
+        )
+
+    def bulk_create(self, repo_names: List[str], description: str = "", private: bool = False) -> List[Dict[str, Any]]:
+        """Creates several repositories in a single GraphQL request.
+        
+        Each repository is an aliased createRepository mutation, so N repositories cost
+        one round-trip instead of N REST calls. The default session never resends the
+        mutation after a 5xx or a timeout: aliases that succeeded the first time would
+        fail as duplicates on the second attempt and be missing from ``created``.
+        
+        Args:
+            repo_names: Names of the repositories to create.
+            description: Description applied to every repository.
+            private: Whether the repositories should be private.
+            
+        Returns:
+            List[Dict[str, Any]]: The created repositories, in the order of repo_names.
+            
+        Raises:
+            ValidationError: If any repository name is invalid or description is not a string.
+            BulkCreateError: If any mutation reports an error. Its ``created`` attribute
+                lists the repositories that were created anyway.
+            GitHubAPIError: If the API request fails.
+        """
+        payloads = [CreateRepoPayload(repo_name, description, private) for repo_name in repo_names]
+        if not payloads:
+            return []
+            
+        aliases = [f"r{index}" for index in range(len(payloads))]
+        declarations = ", ".join(f"${alias}: CreateRepositoryInput!" for alias in aliases)
+        mutations = " ".join(
+            f"{alias}: createRepository(input: ${alias}) {{ repository {{ name }} }}"
+            for alias in aliases
+        )
+        variables = {
+            alias: {
+                "name": payload.name,
+                "description": payload.description,
+                "visibility": "PRIVATE" if payload.private else "PUBLIC"
+            }
+            for alias, payload in zip(aliases, payloads)
+        }
+        
+        for repo_name in repo_names:
+            self._get_cache.pop(repo_name, None)
+        
+        response = self._graphql(f"mutation({declarations}) {{ {mutations} }}", variables)
+        result = self._json(response, "create repositories")
+        if result.get("errors"):
+            # GraphQL reports mutation failures with HTTP 200; other aliases may have succeeded
+            data = result.get("data") or {}
+            created = [
+                data[alias]["repository"]["name"]
+                for alias in aliases
+                if (data.get(alias) or {}).get("repository")
+            ]
+            messages = "; ".join(error.get("message", "Unknown error") for error in result["errors"])
+            raise BulkCreateError(
+                f"Failed to create repositories: {messages} (created: {', '.join(created) or 'none'})",
+                created=created,
+                status_code=response.status_code
             )
-            response.raise_for_status()
-            return response
-        except RequestException as e:
-            status_code = getattr(e.response, 'status_code', None) if hasattr(e, 'response') else None
-            raise GitHubAPIError(
-                f"Failed to delete repository '{repo_name}': {str(e)}",
-                status_code=status_code
-            ) from e
\ No newline at end of file
+        return [result["data"][alias]["repository"] for alias in aliases]
+
+    def bulk_delete(self, repo_names: List[str], quiet: bool = False) -> None:
+        """Deletes several repositories.
+        
+        GitHub's GraphQL API has no repository deletion mutation, so this issues one
+        REST DELETE per repository over the client's pooled keep-alive connection.
+        
+        Args:
+            repo_names: Names of the repositories to delete.
+            quiet: Passed to delete_repo; raise a bare error on 404.
+            
+        Raises:
+            ValidationError: If any repository name is invalid.
+            GitHubAPIError: If any API request fails.
+        """
+        for repo_name in repo_names:
+            self._validate_repo_name(repo_name)
+            
+        for repo_name in repo_names:
+            self.delete_repo(repo_name, quiet=quiet)
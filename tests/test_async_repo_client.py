@@ -0,0 +1,213 @@
+"""
+Test suite for the asynchronous GitHub Repository Client.
+
+Unit tests drive AsyncRepoClient against a scripted fake session; integration tests
+make real GitHub API calls.
+"""
+import asyncio
+import secrets
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from api_clients.async_repo_client import AsyncRepoClient
+from api_clients.repo_client import GitHubAPIError
+
+# Test configuration
+TEST_REPO_PREFIX = "test-async-repo-"
+
+def generate_test_repo_name(prefix=TEST_REPO_PREFIX):
+    """Generate a unique test repository name."""
+    return f"{prefix}{secrets.token_hex(4)}"
+
+class FakeResponse:
+    """Stand-in for aiohttp.ClientResponse used as an async context manager."""
+    
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+    
+    async def json(self, loads, content_type=None):
+        # aiohttp returns None for an empty body
+        return loads(self.body) if self.body.strip() else None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+class FakeSession:
+    """Stand-in for aiohttp.ClientSession that replays scripted responses."""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+    
+    def request(self, method, url, json=None):
+        self.calls.append((method, url, json))
+        return self.responses.pop(0)
+    
+    async def close(self):
+        pass
+
+class TestAsyncRepoClientUnit:
+    """Unit tests for AsyncRepoClient request handling and rate-limit backoff."""
+    
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.client = AsyncRepoClient(token="test-token")
+        self.client.username = "testuser"
+        self.client._repos_path = "/repos/testuser"
+        self.sleep_patcher = patch('api_clients.async_repo_client.asyncio.sleep', new_callable=AsyncMock)
+        self.mock_sleep = self.sleep_patcher.start()
+    
+    def teardown_method(self):
+        """Tear down test fixtures after each test method."""
+        self.sleep_patcher.stop()
+    
+    def run(self, coroutine_factory, *responses):
+        """Run a client coroutine against a fake session replaying the given responses."""
+        self.session = FakeSession(responses)
+        
+        async def runner():
+            self.client.session = self.session
+            self.client._semaphore = asyncio.Semaphore(self.client.max_concurrency)
+            return await coroutine_factory()
+        
+        return asyncio.run(runner())
+    
+    def test_retry_after_seconds(self):
+        """Test that a 429 with Retry-After waits that long and retries."""
+        repo = self.run(
+            lambda: self.client.get_repo("test-repo"),
+            FakeResponse(429, {"Retry-After": "2"}),
+            FakeResponse(200, body=b'{"name": "test-repo"}')
+        )
+        assert repo == {"name": "test-repo"}
+        assert len(self.session.calls) == 2
+        self.mock_sleep.assert_awaited_once_with(2.0)
+    
+    def test_retry_after_http_date(self):
+        """Test that a Retry-After given as an HTTP-date is honoured."""
+        retry_at = formatdate(time.time() + 30, usegmt=True)
+        self.run(
+            lambda: self.client.get_repo("test-repo"),
+            FakeResponse(403, {"Retry-After": retry_at}),
+            FakeResponse(200, body=b'{"name": "test-repo"}')
+        )
+        (delay,), _ = self.mock_sleep.await_args
+        assert 25 <= delay <= 30
+    
+    def test_malformed_retry_after_backs_off(self):
+        """Test that an unparseable Retry-After falls back to exponential backoff."""
+        self.run(
+            lambda: self.client.get_repo("test-repo"),
+            FakeResponse(429, {"Retry-After": "soon"}),
+            FakeResponse(200, body=b'{"name": "test-repo"}')
+        )
+        self.mock_sleep.assert_awaited_once_with(1)
+    
+    def test_rate_limit_remaining_exhausted(self):
+        """Test that a 403 with X-RateLimit-Remaining: 0 waits until the reset time."""
+        reset = str(int(time.time()) + 5)
+        self.run(
+            lambda: self.client.get_repo("test-repo"),
+            FakeResponse(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}),
+            FakeResponse(200, body=b'{"name": "test-repo"}')
+        )
+        (delay,), _ = self.mock_sleep.await_args
+        assert 0 <= delay <= 5
+    
+    def test_plain_forbidden_not_retried(self):
+        """Test that a 403 without rate-limit headers is raised immediately."""
+        with pytest.raises(GitHubAPIError, match="Must have admin rights") as exc_info:
+            self.run(
+                lambda: self.client.delete_repo("test-repo"),
+                FakeResponse(403, body=b'{"message": "Must have admin rights to Repository."}')
+            )
+        assert exc_info.value.status_code == 403
+        assert len(self.session.calls) == 1
+        self.mock_sleep.assert_not_awaited()
+    
+    def test_retry_limit_reached(self):
+        """Test that rate limiting is raised once MAX_RATE_LIMIT_RETRIES is exhausted."""
+        attempts = AsyncRepoClient.MAX_RATE_LIMIT_RETRIES + 1
+        with pytest.raises(GitHubAPIError) as exc_info:
+            self.run(
+                lambda: self.client.get_repo("test-repo"),
+                *(FakeResponse(429, {"Retry-After": "1"}) for _ in range(attempts))
+            )
+        assert exc_info.value.status_code == 429
+        assert len(self.session.calls) == attempts
+        assert self.mock_sleep.await_count == AsyncRepoClient.MAX_RATE_LIMIT_RETRIES
+    
+    def test_retry_delay_above_limit_raised(self):
+        """Test that a wait longer than MAX_RETRY_DELAY is raised instead of slept."""
+        too_long = str(AsyncRepoClient.MAX_RETRY_DELAY + 1)
+        with pytest.raises(GitHubAPIError) as exc_info:
+            self.run(
+                lambda: self.client.get_repo("test-repo"),
+                FakeResponse(429, {"Retry-After": too_long})
+            )
+        assert exc_info.value.status_code == 429
+        self.mock_sleep.assert_not_awaited()
+    
+    def test_no_content_and_empty_body(self):
+        """Test that 204 and empty 2xx bodies return None."""
+        assert self.run(lambda: self.client.delete_repo("test-repo"), FakeResponse(204)) is None
+        assert self.session.calls == [("DELETE", "https://api.github.com/repos/testuser/test-repo", None)]
+        
+        assert self.run(lambda: self.client.get_repo("test-repo"), FakeResponse(200, body=b"")) is None
+    
+    def test_error_without_json_body(self):
+        """Test that an error with a non-JSON body reports the HTTP status."""
+        with pytest.raises(GitHubAPIError, match="HTTP 502") as exc_info:
+            self.run(lambda: self.client.get_repo("test-repo"), FakeResponse(502, body=b"<html>Bad gateway</html>"))
+        assert exc_info.value.status_code == 502
+
+class TestAsyncRepoClientIntegration:
+    """Integration tests for AsyncRepoClient running GitHub API calls concurrently."""
+    
+    def test_concurrent_repo_workflow(self):
+        """Test creating, retrieving, and deleting several repositories concurrently."""
+        repo_names = [generate_test_repo_name("test-async-repo-") for _ in range(3)]
+        
+        async def workflow():
+            async with AsyncRepoClient() as client:
+                try:
+                    # Create and immediately fetch each repo, all repos in parallel
+                    async def create_and_get(name):
+                        await client.create_repo(name, "Async test repo")
+                        return await client.get_repo(name)
+                    
+                    repos = await asyncio.gather(*(create_and_get(name) for name in repo_names))
+                    assert [repo['name'] for repo in repos] == repo_names
+                    
+                    updated = await asyncio.gather(
+                        *(client.update_repo(name, "Updated async repo") for name in repo_names)
+                    )
+                    assert all(repo['description'] == "Updated async repo" for repo in updated)
+                finally:
+                    # Cleanup
+                    await asyncio.gather(
+                        *(client.delete_repo(name) for name in repo_names),
+                        return_exceptions=True
+                    )
+        
+        asyncio.run(workflow())
+    
+    def test_nonexistent_repo(self):
+        """Test that a missing repository raises GitHubAPIError with status 404."""
+        async def fetch_missing():
+            async with AsyncRepoClient() as client:
+                await client.get_repo("this-repo-does-not-exist-12345")
+        
+        with pytest.raises(GitHubAPIError) as exc_info:
+            asyncio.run(fetch_missing())
+        assert exc_info.value.status_code == 404
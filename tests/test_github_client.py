@@ -3,40 +3,52 @@ Comprehensive test suite for GitHub Repository Client.
 
 This file contains all unit, integration, and workflow tests for the RepoClient class.
 """
+import inspect
 import os
 import pytest
-import random
-import string
+import secrets
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import patch, Mock
 
-from api_clients.repo_client import RepoClient, ValidationError, GitHubAPIError
+from api_clients.repo_client import (
+    RepoClient, BulkCreateError, CreateRepoPayload, ValidationError, GitHubAPIError, _default_session
+)
 
 # Test configuration
 TEST_REPO_PREFIX = "test-repo-"
 
 def generate_test_repo_name(prefix=TEST_REPO_PREFIX):
     """Generate a unique test repository name."""
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-    return f"{prefix}{random_suffix}"
+    return f"{prefix}{secrets.token_hex(4)}"
 
 class TestRepoClientUnit:
     """Unit tests for RepoClient using mocks."""
     
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.patcher = patch('api_clients.repo_client.requests')
-        self.mock_requests = self.patcher.start()
-        self.client = RepoClient(token="test-token")
+        RepoClient._USER_CACHE.clear()
+        self.patcher = patch('api_clients.repo_client._default_session')
+        self.mock_session = self.patcher.start().return_value
         
         # Mock successful user authentication
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {'login': 'testuser'}
-        self.mock_requests.get.return_value = mock_response
+        mock_response.content = b'{"login": "testuser"}'
+        self.mock_session.get.return_value = mock_response
+        self.mock_session.post.return_value = Mock(status_code=201)
+        self.mock_session.patch.return_value = Mock(status_code=200)
+        self.mock_session.delete.return_value = Mock(status_code=204)
+        
+        self.client = RepoClient(token="test-token")
     
     def teardown_method(self):
         """Tear down test fixtures after each test method."""
         self.patcher.stop()
+        RepoClient._USER_CACHE.clear()
     
     def test_init_without_token(self):
         """Test initialization without a token raises ValidationError."""
@@ -44,8 +56,7 @@ class TestRepoClientUnit:
             with pytest.raises(ValidationError):
                 RepoClient()
     
-    @patch('api_clients.repo_client.re')
-    def test_validate_repo_name(self, mock_re):
+    def test_validate_repo_name(self):
         """Test repository name validation."""
         # Test empty name
         with pytest.raises(ValidationError, match="Repository name cannot be empty"):
@@ -57,30 +68,357 @@ class TestRepoClientUnit:
             self.client._validate_repo_name(long_name)
 
         # Test invalid characters
-        invalid_names = ["invalid/name", ".start-with-dot", "end-with-dot.", "has space"]
+        invalid_names = ["invalid/name", "has space", "emoji-\u2603", "tab\tname", "newline\n"]
         for name in invalid_names:
-            mock_re.match.return_value = None  # Simulate pattern not matching
             with pytest.raises(ValidationError, match="Repository name can only contain alphanumeric characters"):
                 self.client._validate_repo_name(name)
-            mock_re.match.assert_called_once_with(self.client.REPO_NAME_PATTERN, name)
-            mock_re.match.reset_mock()
+
+        # Test invalid leading/trailing characters
+        for name in ["-start-with-dash", "end-with-dot."]:
+            with pytest.raises(ValidationError, match="cannot start with '-' or end with '.'"):
+                self.client._validate_repo_name(name)
 
         # Test valid names
-        valid_names = ["test", "test123", "test-repo", "test.repo", "test_repo"]
+        valid_names = ["test", "test123", "test-repo", "test.repo", "test_repo", ".github", "a" * 100]
         for name in valid_names:
-            mock_re.match.return_value = True  # Simulate pattern matching
             try:
                 self.client._validate_repo_name(name)
-                mock_re.match.assert_called_once_with(self.client.REPO_NAME_PATTERN, name)
             except ValidationError:
                 pytest.fail(f"Valid name '{name}' failed validation")
-            mock_re.match.reset_mock()
+    
+    def test_validate_repo_name_memoized(self):
+        """Test that repeated validation of a valid name is served from the cache."""
+        RepoClient._validate_repo_name.cache_clear()
+        self.client._validate_repo_name("memoized-repo")
+        self.client._validate_repo_name("memoized-repo")
+        assert RepoClient._validate_repo_name.cache_info().hits == 1
+        
+        # Invalid names raise every time instead of being cached
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                self.client._validate_repo_name("invalid/name")
     
     @patch.object(RepoClient, '_validate_repo_name')
     def test_create_repo_validation(self, mock_validate):
         """Test create_repo input validation."""
         self.client.create_repo("test-repo")
         mock_validate.assert_called_once_with("test-repo")
+    
+    def test_create_repo_payload(self):
+        """Test the create payload is validated on construction and posted as JSON."""
+        with pytest.raises(ValidationError, match="Description must be a string"):
+            CreateRepoPayload("test-repo", description=123)
+        
+        self.client.create_repo("test-repo", "A description", private=True)
+        _, kwargs = self.mock_session.post.call_args
+        assert kwargs['json'] == {
+            "name": "test-repo",
+            "description": "A description",
+            "private": True,
+            "auto_init": False
+        }
+    
+    def test_exists(self):
+        """Test that exists probes with HEAD and maps 200/404 to True/False."""
+        self.mock_session.head.return_value = Mock(status_code=200)
+        assert self.client.exists("test-repo") is True
+        self.mock_session.head.assert_called_once_with(
+            "https://api.github.com/repos/testuser/test-repo",
+            allow_redirects=False,
+            timeout=10
+        )
+        
+        self.mock_session.head.return_value = Mock(status_code=404)
+        assert self.client.exists("test-repo") is False
+        
+        self.mock_session.head.return_value = Mock(status_code=401, reason="Unauthorized")
+        with pytest.raises(GitHubAPIError) as exc_info:
+            self.client.exists("test-repo")
+        assert exc_info.value.status_code == 401
+    
+    def test_quiet_not_found(self):
+        """Test that quiet=True raises a fresh bare 404 error and is only accepted where declared."""
+        self.mock_session.delete.return_value = Mock(status_code=404, reason="Not Found")
+        errors = []
+        for _ in range(2):
+            with pytest.raises(GitHubAPIError) as exc_info:
+                self.client.delete_repo("test-repo", quiet=True)
+            errors.append(exc_info.value)
+        
+        assert errors[0] is not errors[1]
+        assert str(errors[0]) == "not found"
+        assert errors[0].status_code == 404
+        assert "quiet" in inspect.signature(RepoClient.delete_repo).parameters
+        with pytest.raises(TypeError):
+            self.client._head_repo("test-repo", quiet=True)
+        
+        # bulk_delete forwards quiet to delete_repo
+        with pytest.raises(GitHubAPIError, match="^not found$"):
+            self.client.bulk_delete(["test-repo"], quiet=True)
+        
+        # The default keeps the descriptive error
+        with pytest.raises(GitHubAPIError, match="Failed to delete repository 'test-repo'"):
+            self.client.delete_repo("test-repo")
+    
+    def test_requests_use_shared_session(self):
+        """Test that API calls go through the client's persistent session."""
+        assert self.client.username == 'testuser'
+        self.client.get_repo("test-repo")
+        self.mock_session.get.assert_called_with(
+            "https://api.github.com/repos/testuser/test-repo",
+            headers=None,
+            timeout=10
+        )
+    
+    def test_custom_session_factory(self):
+        """Test that a session_factory replaces the default requests session."""
+        custom_session = Mock(headers={})
+        custom_session.get.return_value = Mock(status_code=200, content=b'{"login": "otheruser"}')
+        client = RepoClient(token="factory-token", session_factory=lambda: custom_session)
+        assert client.session is custom_session
+        assert client.username == 'otheruser'
+        assert custom_session.headers == {
+            "Authorization": "token factory-token",
+            "Accept": "application/vnd.github.v3+json"
+        }
+    
+    def test_session_closed_when_authentication_fails(self):
+        """Test that the session is closed if the token cannot be verified."""
+        stub_session = Mock(headers={})
+        stub_session.get.return_value = Mock(status_code=401)
+        with pytest.raises(GitHubAPIError):
+            RepoClient(token="bad-token", session_factory=lambda: stub_session)
+        stub_session.close.assert_called_once()
+    
+    def test_non_json_user_response(self):
+        """Test that a non-JSON body, e.g. a proxy page, surfaces as GitHubAPIError."""
+        stub_session = Mock(headers={})
+        stub_session.get.return_value = Mock(status_code=200, content=b'<html>proxy</html>')
+        with pytest.raises(GitHubAPIError, match="Failed to authenticate with GitHub") as exc_info:
+            RepoClient(token="proxy-token", session_factory=lambda: stub_session)
+        assert exc_info.value.status_code == 200
+        stub_session.close.assert_called_once()
+    
+    def test_username_cached_per_token(self):
+        """Test that the authenticated user is fetched once per token."""
+        RepoClient(token="test-token")
+        RepoClient(token="test-token")
+        assert self.mock_session.get.call_count == 1
+        
+        RepoClient(token="other-token")
+        assert self.mock_session.get.call_count == 2
+    
+    def test_get_repo_cached_until_modified(self):
+        """Test that repeated get_repo calls reuse the cached response until the repo changes."""
+        self.mock_session.get.reset_mock()
+        first = self.client.get_repo("test-repo")
+        assert self.client.get_repo("test-repo") is first
+        assert self.mock_session.get.call_count == 1
+        
+        self.client.update_repo("test-repo", "New description")
+        self.client.get_repo("test-repo")
+        assert self.mock_session.get.call_count == 2
+    
+    def test_get_repo_cache_disabled(self):
+        """Test that a zero TTL always re-fetches the repository."""
+        self.client.cache_ttl = 0
+        self.mock_session.get.reset_mock()
+        self.client.get_repo("test-repo")
+        self.client.get_repo("test-repo")
+        assert self.mock_session.get.call_count == 2
+    
+    def test_get_repo_revalidates_with_etag(self):
+        """Test that a stale cached repo is revalidated with If-None-Match and reused on 304."""
+        self.client.cache_ttl = 0
+        fresh = Mock(status_code=200, headers={'ETag': '"abc123"'})
+        not_modified = Mock(status_code=304, headers={})
+        self.mock_session.get.side_effect = [fresh, not_modified]
+        
+        assert self.client.get_repo("test-repo") is fresh
+        assert self.client.get_repo("test-repo") is fresh
+        _, kwargs = self.mock_session.get.call_args
+        assert kwargs['headers'] == {'If-None-Match': '"abc123"'}
+    
+    def test_get_repo_cache_bounded(self):
+        """Test that failed fetches are evicted and the oldest entry goes once the cache is full."""
+        self.client.cache_ttl = 0
+        self.mock_session.get.return_value = Mock(status_code=200, headers={'ETag': '"abc123"'})
+        self.client.get_repo("test-repo")
+        self.mock_session.get.return_value = Mock(status_code=404, reason="Not Found")
+        with pytest.raises(GitHubAPIError):
+            self.client.get_repo("test-repo")
+        assert "test-repo" not in self.client._get_cache
+        
+        self.client.GET_CACHE_MAXSIZE = 2
+        self.mock_session.get.return_value = Mock(status_code=200, headers={})
+        for name in ["repo-a", "repo-b", "repo-c"]:
+            self.client.get_repo(name)
+        assert list(self.client._get_cache) == ["repo-b", "repo-c"]
+    
+    def test_request_errors_translated(self):
+        """Test that network errors surface as GitHubAPIError naming the operation."""
+        # Imported here so collecting the mock-only tests does not load requests
+        from requests.exceptions import RequestException
+        
+        self.mock_session.delete.side_effect = RequestException("connection reset")
+        with pytest.raises(GitHubAPIError, match="Failed to delete repository 'test-repo': connection reset") as exc_info:
+            self.client.delete_repo("test-repo")
+        assert exc_info.value.status_code is None
+    
+    def test_error_status_raises_github_api_error(self):
+        """Test that an error status code is raised with the status and operation."""
+        self.mock_session.patch.return_value = Mock(status_code=404, reason="Not Found")
+        with pytest.raises(GitHubAPIError, match="Failed to update repository 'test-repo': HTTP 404 Not Found") as exc_info:
+            self.client.update_repo("test-repo", "New description")
+        assert exc_info.value.status_code == 404
+    
+    def test_create_repo_validation_error_message(self):
+        """Test that a 422 on create reports GitHub's validation message."""
+        self.mock_session.post.return_value = Mock(
+            status_code=422,
+            content=b'{"message": "Repository creation failed."}'
+        )
+        with pytest.raises(GitHubAPIError, match="Repository creation failed.") as exc_info:
+            self.client.create_repo("test-repo")
+        assert exc_info.value.status_code == 422
+    
+    def test_bulk_create_single_graphql_request(self):
+        """Test that bulk_create sends every repository in one aliased GraphQL mutation."""
+        self.mock_session.post.return_value = Mock(
+            status_code=200,
+            content=b'{"data": {"r0": {"repository": {"name": "repo-a"}}, "r1": {"repository": {"name": "repo-b"}}}}'
+        )
+        repos = self.client.bulk_create(["repo-a", "repo-b"], private=True)
+        
+        assert [repo['name'] for repo in repos] == ["repo-a", "repo-b"]
+        self.mock_session.post.assert_called_once()
+        args, kwargs = self.mock_session.post.call_args
+        assert args[0] == "https://api.github.com/graphql"
+        assert "r1: createRepository(input: $r1)" in kwargs['json']['query']
+        assert kwargs['json']['variables']['r0'] == {
+            "name": "repo-a", "description": "", "visibility": "PRIVATE"
+        }
+    
+    def test_bulk_create_reports_graphql_errors(self):
+        """Test that GraphQL errors returned with a 200 status raise GitHubAPIError."""
+        self.mock_session.post.return_value = Mock(
+            status_code=200,
+            content=b'{"data": {"r0": {"repository": {"name": "repo-a"}}, "r1": null}, '
+                    b'"errors": [{"message": "Name already exists on this account"}]}'
+        )
+        with pytest.raises(BulkCreateError, match="Name already exists on this account") as exc_info:
+            self.client.bulk_create(["repo-a", "repo-b"])
+        assert exc_info.value.created == ["repo-a"]
+        assert exc_info.value.status_code == 200
+    
+    def test_graphql_url_for_enterprise(self):
+        """Test that GraphQL requests go to /api/graphql on GitHub Enterprise."""
+        client = RepoClient(token="test-token", base_url="https://ghe.example.com/api/v3")
+        assert client._graphql_url == "https://ghe.example.com/api/graphql"
+        assert self.client._graphql_url == "https://api.github.com/graphql"
+    
+    def test_errors_without_requests(self):
+        """Test that errors propagate unchanged when requests is unavailable."""
+        class SessionError(Exception):
+            """Stand-in for an error raised by a non-requests session."""
+        
+        with patch.dict(sys.modules, {"requests": None, "requests.exceptions": None}):
+            with pytest.raises(ValidationError):
+                self.client.create_repo("bad/name")
+            
+            self.mock_session.delete.side_effect = SessionError("boom")
+            with pytest.raises(SessionError):
+                self.client.delete_repo("test-repo")
+            
+            stub_session = Mock(headers={})
+            stub_session.get.return_value = Mock(status_code=401)
+            with pytest.raises(GitHubAPIError) as exc_info:
+                RepoClient(token="stub-token", session_factory=lambda: stub_session)
+            assert exc_info.value.status_code == 401
+    
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the session."""
+        with self.client as client:
+            assert client is self.client
+        self.mock_session.close.assert_called_once()
+
+class TestDefaultSessionRetry:
+    """Tests for the default session's retry policy against a local HTTP server."""
+    
+    def setup_method(self):
+        """Start a local server that replays a scripted list of responses."""
+        self.responses = []
+        self.requests_seen = 0
+        self.delay = 0
+        test = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                test.requests_seen += 1
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                time.sleep(test.delay)
+                status, headers = test.responses.pop(0)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            
+            do_POST = do_GET
+            
+            def log_message(self, *args):
+                pass
+        
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.url = f"{self.base_url}/user"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.session = _default_session()
+    
+    def teardown_method(self):
+        """Stop the local server."""
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        RepoClient._USER_CACHE.clear()
+    
+    def test_secondary_rate_limit_retried(self):
+        """Test that a 403 with Retry-After is retried."""
+        self.responses = [(403, {"Retry-After": "0"}), (200, {})]
+        response = self.session.get(self.url, timeout=5)
+        assert response.status_code == 200
+        assert self.requests_seen == 2
+    
+    def test_plain_forbidden_not_retried(self):
+        """Test that a 403 without Retry-After is returned immediately."""
+        self.responses = [(403, {}), (200, {})]
+        response = self.session.get(self.url, timeout=5)
+        assert response.status_code == 403
+        assert self.requests_seen == 1
+    
+    def test_post_not_resent_after_server_error(self):
+        """Test that a POST is not resent after a 5xx, which may hide a success."""
+        self.responses = [(502, {}), (201, {})]
+        response = self.session.post(self.url, json={"name": "test-repo"}, timeout=5)
+        assert response.status_code == 502
+        assert self.requests_seen == 1
+    
+    def test_rate_limited_post_retried(self):
+        """Test that a rate-limited POST, which GitHub did not process, is resent."""
+        self.responses = [(403, {"Retry-After": "0"}), (201, {})]
+        response = self.session.post(self.url, json={"name": "test-repo"}, timeout=5)
+        assert response.status_code == 201
+        assert self.requests_seen == 2
+    
+    def test_timed_out_bulk_create_not_resent(self):
+        """Test that a timed-out GraphQL mutation is not resent, which would turn created repos into errors."""
+        RepoClient._USER_CACHE[(self.base_url, "test-token")] = "testuser"
+        client = RepoClient(token="test-token", base_url=self.base_url, timeout=0.2)
+        self.responses = [(200, {}), (200, {})]
+        self.delay = 0.5
+        with client, pytest.raises(GitHubAPIError, match="Failed to run GraphQL query"):
+            client.bulk_create(["repo-a", "repo-b"])
+        assert self.requests_seen == 1
 
 class TestRepoClientIntegration:
     """Integration tests for RepoClient with real GitHub API calls."""
@@ -102,12 +440,16 @@ class TestRepoClientIntegration:
     def teardown_class(cls):
         """Clean up after all tests are done."""
         try:
-            cls.client.delete_repo(cls.test_repo)
+            cls.client.delete_repo(cls.test_repo, quiet=True)
         except GitHubAPIError:
             pass  # Ignore if already deleted
+        finally:
+            cls.client.close()
     
     def test_create_and_get_repo(self):
         """Test creating and retrieving a repository."""
+        assert self.client.exists(self.test_repo)
+        
         response = self.client.get_repo(self.test_repo)
         assert response.status_code == 200
         repo_data = response.json()
@@ -144,10 +486,32 @@ class TestRepoClientIntegration:
         finally:
             # Cleanup
             try:
-                self.client.delete_repo(repo_name)
+                self.client.delete_repo(repo_name, quiet=True)
             except GitHubAPIError:
                 pass
 
+    def test_bulk_create_and_delete(self):
+        """Test creating and deleting several repositories in bulk."""
+        repo_names = [generate_test_repo_name("test-bulk-repo-") for _ in range(3)]
+        try:
+            repos = self.client.bulk_create(repo_names, "Bulk test repo")
+            assert [repo['name'] for repo in repos] == repo_names
+            
+            response = self.client.get_repo(repo_names[-1])
+            assert response.json()['description'] == "Bulk test repo"
+            
+            self.client.bulk_delete(repo_names)
+            with pytest.raises(GitHubAPIError) as exc_info:
+                self.client.get_repo(repo_names[0])
+            assert exc_info.value.status_code == 404
+        finally:
+            # Cleanup anything left behind by a failed assertion
+            for name in repo_names:
+                try:
+                    self.client.delete_repo(name, quiet=True)
+                except GitHubAPIError:
+                    pass
+
 class TestErrorHandling:
     """Tests for error handling and edge cases."""
     
@@ -156,8 +520,15 @@ class TestErrorHandling:
         self.client = RepoClient()
         self.non_existent_repo = "this-repo-does-not-exist-12345"
     
+    def teardown_method(self):
+        """Tear down test fixtures after each test method."""
+        self.client.close()
+    
     def test_nonexistent_repo_operations(self):
         """Test operations on non-existent repository."""
+        # Test existence probe
+        assert not self.client.exists(self.non_existent_repo)
+        
         # Test get
         with pytest.raises(GitHubAPIError) as exc_info:
             self.client.get_repo(self.non_existent_repo)
@@ -188,7 +559,7 @@ class TestErrorHandling:
         finally:
             # Cleanup
             try:
-                self.client.delete_repo(temp_repo)
+                self.client.delete_repo(temp_repo, quiet=True)
             except GitHubAPIError:
                 pass
 